@@ -67,6 +67,7 @@ def generate(url, file, output, asyncio, regen):
     """
     Generate a new client from an OpenAPI schema
     """
+    from io import BytesIO
     from json import JSONDecodeError
 
     import yaml
@@ -89,17 +90,26 @@ def generate(url, file, output, asyncio, regen):
             # It's probably yaml
             data = yaml.safe_load(response.content)
         spec = Spec.from_dict(data)
+        spec_content = response.content
     else:
-        with open(file, "r") as f:
-            spec = Spec.from_file(f)
+        with open(file, "rb") as f:
+            spec_content = f.read()
+        spec = Spec.from_file(BytesIO(spec_content))
     console.log(f"Found API specification: {spec['info']['title']} | version {spec['info']['version']}")
     major, _, _ = spec["openapi"].split(".")
     if int(major) < 3:
         console.log(f"[red]Clientele only supports OpenAPI version 3.0.0 and up, and you have {spec['openapi']}")
         return
-    generator = StandardGenerator(spec=spec, asyncio=asyncio, regen=regen, output_dir=output, url=url, file=file)
-    if generator.prevent_accidental_regens():
-        generator.generate()
+    generator = StandardGenerator(
+        spec=spec,
+        asyncio=asyncio,
+        regen=regen,
+        output_dir=output,
+        url=url,
+        file=file,
+        spec_content=spec_content,
+    )
+    if generator.prevent_accidental_regens() and generator.generate():
         console.log("\n[green]⚜️ Client generated! ⚜️ \n")
         console.log("[yellow]REMEMBER: install `httpx` `pydantic`, and `respx` to use your new client")
 
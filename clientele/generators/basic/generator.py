@@ -1,5 +1,4 @@
-from os import remove
-from os.path import exists
+from pathlib import Path
 
 from clientele import settings, utils
 from clientele.generators.basic import writer
@@ -27,9 +26,11 @@ class BasicGenerator:
         )
 
     def generate(self) -> None:
+        # A failed generation in this process may have left partial output behind
+        writer.reset_buffers(self.output_dir)
         client_project_directory_path = utils.get_client_project_directory_path(output_dir=self.output_dir)
-        if exists(f"{self.output_dir}/MANIFEST.md"):
-            remove(f"{self.output_dir}/MANIFEST.md")
+        output_path = Path(self.output_dir)
+        (output_path / "MANIFEST.md").unlink(missing_ok=True)
         manifest_template = writer.templates.get_template("manifest.jinja2")
         manifest_content = manifest_template.render(command=f"-o {self.output_dir}", clientele_version=settings.VERSION)
         writer.write_to_manifest(content=manifest_content + "\n", output_dir=self.output_dir)
@@ -39,10 +40,10 @@ class BasicGenerator:
             client_template_file,
             write_func,
         ) in self.file_name_writer_tuple:
-            if exists(f"{self.output_dir}/{client_file}"):
-                remove(f"{self.output_dir}/{client_file}")
+            (output_path / client_file).unlink(missing_ok=True)
             template = writer.templates.get_template(client_template_file)
             content = template.render(
                 client_project_directory_path=client_project_directory_path,
             )
             write_func(content, output_dir=self.output_dir)
+        writer.flush_buffers()
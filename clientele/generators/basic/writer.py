@@ -1,44 +1,93 @@
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 
 from jinja2 import Environment, PackageLoader
 
-templates = Environment(loader=PackageLoader("clientele", "generators/basic/templates/"))
+from clientele import utils
+
+templates = Environment(
+    loader=PackageLoader("clientele", "generators/basic/templates/"),
+    # Templates ship with the package and never change underneath us
+    auto_reload=False,
+    bytecode_cache=utils.get_template_bytecode_cache(),
+)
+
+# Content is buffered per file, already encoded, and written out once by flush_buffers()
+_file_buffers: dict[Path, bytearray] = defaultdict(bytearray)
+
+
+@lru_cache(maxsize=None)
+def _output_path(output_dir: str, file_name: str) -> Path:
+    return Path(output_dir) / file_name
 
 
 def write_to_schemas(content: str, output_dir: str) -> None:
-    path = Path(output_dir) / "schemas.py"
+    path = _output_path(output_dir, "schemas.py")
     _write_to(path, content)
 
 
 def write_to_http(content: str, output_dir: str) -> None:
-    path = Path(output_dir) / "http.py"
+    path = _output_path(output_dir, "http.py")
     _write_to(path, content)
 
 
 def write_to_client(content: str, output_dir: str) -> None:
-    path = Path(output_dir) / "client.py"
+    path = _output_path(output_dir, "client.py")
     _write_to(path, content)
 
 
 def write_to_manifest(content: str, output_dir: str) -> None:
-    path = Path(output_dir) / "MANIFEST.md"
+    path = _output_path(output_dir, "MANIFEST.md")
     _write_to(path, content)
 
 
 def write_to_config(content: str, output_dir: str) -> None:
-    path = Path(output_dir) / "config.py"
+    path = _output_path(output_dir, "config.py")
     _write_to(path, content)
 
 
 def write_to_init(output_dir: str) -> None:
-    path = Path(output_dir) / "__init__.py"
-    _write_to(path, "")
+    # Nothing to buffer, the file just needs to exist
+    path = _output_path(output_dir, "__init__.py")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
 
 
 def _write_to(
     path: Path,
     content: str,
 ) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a+") as f:
-        f.write(content)
+    _buffer_content(path, content)
+
+
+def _buffer_content(path: Path, content: str) -> None:
+    _file_buffers[path] += content.encode("utf-8")
+
+
+def reset_buffers(output_dir: str) -> None:
+    """
+    Drop anything buffered for output_dir, such as the partial
+    output of a generation that failed part way through.
+    """
+    output_path = Path(output_dir)
+    for path, buffer in _file_buffers.items():
+        if path.parent == output_path:
+            buffer.clear()
+
+
+def flush_buffers() -> None:
+    """
+    Write all the buffered content out to disk.
+    Each file is opened once and its buffer written in a single call.
+    """
+    created_dirs: set[Path] = set()
+    for path, buffer in _file_buffers.items():
+        if not buffer:
+            continue
+        if path.parent not in created_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(path.parent)
+        with path.open("ab") as f:
+            f.write(buffer)
+        buffer.clear()
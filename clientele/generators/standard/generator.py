@@ -1,4 +1,4 @@
-from os import remove
+import hashlib
 from os.path import exists
 from pathlib import Path
 from typing import Optional
@@ -30,6 +30,8 @@ class StandardGenerator:
     output_dir: str
     file: Optional[str]
     url: Optional[str]
+    spec_content: Optional[bytes]
+    spec_hash: Optional[str]
 
     def __init__(
         self,
@@ -39,6 +41,7 @@ class StandardGenerator:
         regen: bool,
         url: Optional[str],
         file: Optional[str],
+        spec_content: Optional[bytes] = None,
     ) -> None:
         self.http_generator = http.HTTPGenerator(spec=spec, output_dir=output_dir, asyncio=asyncio)
         self.schemas_generator = schemas.SchemasGenerator(spec=spec, output_dir=output_dir)
@@ -61,20 +64,22 @@ class StandardGenerator:
             ("http.py", "http_py.jinja2", writer.write_to_http),
             ("schemas.py", "schemas_py.jinja2", writer.write_to_schemas),
         )
+        self.spec_content = spec_content
+        self.spec_hash = self.get_spec_hash()
 
     def generate_templates_files(self):
         new_unions = settings.PY_VERSION[1] > 10
         client_project_directory_path = utils.get_client_project_directory_path(output_dir=self.output_dir)
+        output_path = Path(self.output_dir)
         writer.write_to_init(output_dir=self.output_dir)
         for (
             client_file,
             client_template_file,
             write_func,
         ) in self.file_name_writer_tuple:
-            if exists(f"{self.output_dir}/{client_file}"):
-                if client_file == "config.py":  # do not replace config.py if exists
-                    continue
-                remove(f"{self.output_dir}/{client_file}")
+            # Other files are replaced when the buffers are flushed
+            if client_file == "config.py" and (output_path / client_file).exists():
+                continue  # do not replace config.py if exists
             template = writer.templates.get_template(client_template_file)
             content = template.render(
                 client_project_directory_path=client_project_directory_path,
@@ -82,8 +87,6 @@ class StandardGenerator:
             )
             write_func(content, output_dir=self.output_dir)
         # Manifest file
-        if exists(f"{self.output_dir}/MANIFEST.md"):
-            remove(f"{self.output_dir}/MANIFEST.md")
         template = writer.templates.get_template("manifest.jinja2")
         generate_command = f'{f"-u {self.url}" if self.url else ""}{f"-f {self.file}" if self.file else ""} -o {self.output_dir} {"--asyncio t" if self.asyncio else ""} --regen t'  # noqa
         content = (
@@ -100,19 +103,74 @@ class StandardGenerator:
     def prevent_accidental_regens(self) -> bool:
         if exists(self.output_dir):
             if not self.regen:
+                if self.client_is_up_to_date():
+                    # Nothing would change, generate() will say so
+                    return True
                 console.log("[red]WARNING! If you want to regenerate, please pass --regen t")
                 return False
         return True
 
+    def get_spec_hash(self) -> Optional[str]:
+        """
+        Returns a hash of everything that goes into the generated client:
+        the raw spec, the templates, the clientele version and the generation options.
+        Without the raw spec there is nothing reliable to hash, so this returns None.
+        """
+        if self.spec_content is None:
+            return None
+        spec_hash = hashlib.sha256(self.spec_content)
+        spec_hash.update(writer.get_templates_digest().encode("utf-8"))
+        options = (settings.VERSION, settings.PY_VERSION[1] > 10, self.asyncio, self.output_dir, self.url, self.file)
+        spec_hash.update(repr(options).encode("utf-8"))
+        return spec_hash.hexdigest()
+
+    def client_is_up_to_date(self) -> bool:
+        """
+        True if the client in output_dir was generated from this exact spec
+        and options, and none of its files have gone missing since.
+        """
+        if self.spec_hash is None or writer.read_spec_hash(self.output_dir) != self.spec_hash:
+            return False
+        output_path = Path(self.output_dir)
+        client_files = [client_file for client_file, _, _ in self.file_name_writer_tuple]
+        return all((output_path / f).exists() for f in [*client_files, "__init__.py", "MANIFEST.md"])
+
     def format_client(self) -> None:
-        directory = Path(self.output_dir)
-        for f in directory.glob("*.py"):
-            black.format_file_in_place(f, fast=False, mode=black.Mode(), write_back=black.WriteBack.YES)
+        # The same mode applies to every file, so build it once
+        mode = black.Mode()
+
+        def format_content(content: str) -> str:
+            try:
+                return black.format_file_contents(content, fast=False, mode=mode)
+            except black.NothingChanged:
+                return content
 
-    def generate(self) -> None:
+        # Formatting happens in memory so an unchanged client is not rewritten on disk
+        writer.format_buffers(".py", format_content)
+
+    def generate(self) -> bool:
+        """
+        Generate the client and return True, or return False without
+        writing anything if the client is already up to date.
+        Passing regen always generates the client again.
+        """
+        if not self.regen and self.client_is_up_to_date():
+            console.log("Client is already up to date with the schema, nothing to do...")
+            return False
+        # A failed generation in this process may have left partial output behind
+        writer.reset_buffers(self.output_dir)
+        # The old hash no longer describes the client, a new one is only written once this run succeeds
+        writer.remove_spec_hash(self.output_dir)
         self.generate_templates_files()
         self.schemas_generator.generate_schema_classes()
         self.clients_generator.generate_paths()
         self.http_generator.generate_http_content()
         self.schemas_generator.write_helpers()
-        self.format_client()
+        try:
+            self.format_client()
+            # Only record the hash once the client has been formatted successfully
+            if self.spec_hash is not None:
+                writer.write_to_spec_hash(self.spec_hash, output_dir=self.output_dir)
+        finally:
+            writer.flush_buffers()
+        return True
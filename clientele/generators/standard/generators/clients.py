@@ -1,8 +1,10 @@
 from collections import defaultdict
-from typing import Optional
+from dataclasses import dataclass
+from itertools import chain
+from typing import Callable, Optional
 
+from jinja2 import Template
 from openapi_core import Spec
-from pydantic import BaseModel
 from rich.console import Console
 
 from clientele.generators.standard import utils, writer
@@ -10,8 +12,19 @@ from clientele.generators.standard.generators import http, schemas
 
 console = Console()
 
+_OPTIONAL_PREFIX = "typing.Optional["
+_OPTIONAL_SUFFIX = "]"
 
-class ParametersResponse(BaseModel):
+
+def _parameter_type(schema: dict, required: bool) -> str:
+    arg_type = utils.get_type(schema)
+    if required:
+        return arg_type
+    return _OPTIONAL_PREFIX + arg_type + _OPTIONAL_SUFFIX
+
+
+@dataclass
+class ParametersResponse:
     # Parameters that need to be passed in the URL query
     query_args: dict[str, str]
     # Parameters that need to be passed as variables in the function
@@ -21,7 +34,7 @@ class ParametersResponse(BaseModel):
 
     def get_path_args_as_string(self):
         # Get all the path arguments, and the query arguments and make a big string out of them.
-        args = list(self.path_args.items()) + list(self.query_args.items())
+        args = chain(self.path_args.items(), self.query_args.items())
         return ", ".join(f"{k}: {v}" for k, v in args)
 
 
@@ -31,11 +44,15 @@ class ClientsGenerator:
     """
 
     method_template_map: dict[str, str]
+    valid_methods: frozenset[str]
+    method_templates: dict[str, Template]
+    methods_with_body: frozenset[str]
     results: dict[str, int]
     spec: Spec
     output_dir: str
     schemas_generator: schemas.SchemasGenerator
     http_generator: http.HTTPGenerator
+    append_to_client: Callable[[str], None]
 
     def __init__(
         self,
@@ -51,6 +68,7 @@ class ClientsGenerator:
         self.schemas_generator = schemas_generator
         self.http_generator = http_generator
         self.asyncio = asyncio
+        self.append_to_client = writer.get_appender(output_dir, "client.py")
         self.method_template_map = dict(
             get="get_method.jinja2",
             delete="get_method.jinja2",
@@ -58,23 +76,31 @@ class ClientsGenerator:
             put="post_method.jinja2",
             patch="post_method.jinja2",
         )
+        self.valid_methods = frozenset(self.method_template_map)
+        self.method_templates = {
+            method: writer.templates.get_template(template) for method, template in self.method_template_map.items()
+        }
+        # Methods rendered with the post template take a request body
+        self.methods_with_body = frozenset(
+            method for method, template in self.method_template_map.items() if template == "post_method.jinja2"
+        )
 
     def generate_paths(self) -> None:
         for path in self.spec["paths"].items():
             self.write_path_to_client(path=path)
-        console.log(f"Generated {self.results['get']} GET methods...")
-        console.log(f"Generated {self.results['post']} POST methods...")
-        console.log(f"Generated {self.results['put']} PUT methods...")
-        console.log(f"Generated {self.results['patch']} PATCH methods...")
-        console.log(f"Generated {self.results['delete']} DELETE methods...")
+        console.log(
+            "\n".join(
+                f"Generated {self.results[method]} {method.upper()} methods..."
+                for method in ("get", "post", "put", "patch", "delete")
+            )
+        )
 
     def generate_parameters(self, parameters: list[dict], additional_parameters: list[dict]) -> ParametersResponse:
-        param_keys = []
+        param_keys: set[str] = set()
         query_args = {}
         path_args = {}
         headers_args = {}
-        all_parameters = parameters + additional_parameters
-        for param in all_parameters:
+        for param in chain(parameters, additional_parameters):
             if param.get("$ref"):
                 # Get the actual parameter it is referencing
                 param = utils.get_param_from_ref(spec=self.spec, param=param)
@@ -85,20 +111,14 @@ class ClientsGenerator:
             required = param.get("required", False) or in_ != "query"
             if in_ == "query":
                 # URL query string values
-                if required:
-                    query_args[clean_key] = utils.get_type(param["schema"])
-                else:
-                    query_args[clean_key] = f"typing.Optional[{utils.get_type(param['schema'])}]"
+                query_args[clean_key] = _parameter_type(param["schema"], required)
             elif in_ == "path":
                 # Function arguments
-                if required:
-                    path_args[clean_key] = utils.get_type(param["schema"])
-                else:
-                    path_args[clean_key] = f"typing.Optional[{utils.get_type(param['schema'])}]"
+                path_args[clean_key] = _parameter_type(param["schema"], required)
             elif in_ == "header":
                 # Header object arguments
                 headers_args[param["name"]] = utils.get_type(param["schema"])
-            param_keys.append(clean_key)
+            param_keys.add(clean_key)
         return ParametersResponse(
             query_args=query_args,
             path_args=path_args,
@@ -114,31 +134,39 @@ class ClientsGenerator:
         """
         status_code_map: dict[str, str] = {}
         response_classes = []
+        seen_class_names: set[str] = set()
         for status_code, details in responses.items():
             for _, content in details.get("content", {}).items():
                 class_name = ""
-                if ref := content["schema"].get("$ref", False):
+                # The schema we need to generate for this response, if any
+                new_schema_key: Optional[str] = None
+                new_schema: dict = {}
+                if ref := content["schema"].get("$ref"):
                     # An object reference, so should be generated
                     # by the schema generator later.
                     class_name = utils.class_name_titled(utils.schema_ref(ref))
-                elif title := content["schema"].get("title", False):
+                elif title := content["schema"].get("title"):
                     # This usually means we have an object that isn't
                     # $ref so we need to create the schema class here
                     class_name = utils.class_name_titled(title)
-                    self.schemas_generator.make_schema_class(class_name, schema=content["schema"])
+                    new_schema_key, new_schema = class_name, content["schema"]
                 else:
                     # At this point we're just making things up!
                     # It is likely it isn't an object it is just a simple resonse.
                     class_name = utils.class_name_titled(func_name + status_code + "Response")
                     # We need to generate the class at this point because it does not exist
-                    self.schemas_generator.make_schema_class(
-                        func_name + status_code + "Response",
-                        schema={"properties": {"test": content["schema"]}},
-                    )
+                    new_schema_key = func_name + status_code + "Response"
+                    new_schema = {"properties": {"test": content["schema"]}}
                 status_code_map[status_code] = class_name
-                response_classes.append(class_name)
+                if new_schema_key:
+                    # Content types can share a class name with different schemas,
+                    # make_schema_class skips the ones that are exact repeats
+                    self.schemas_generator.make_schema_class(new_schema_key, schema=new_schema)
+                if class_name not in seen_class_names:
+                    seen_class_names.add(class_name)
+                    response_classes.append(class_name)
         self.http_generator.add_status_codes_to_bundle(func_name=func_name, status_code_map=status_code_map)
-        return sorted(list(set(response_classes)))
+        return sorted(response_classes)
 
     def get_input_class_names(self, inputs: dict) -> list[str]:
         """
@@ -148,16 +176,17 @@ class ClientsGenerator:
         for _, details in inputs.items():
             for encoding, content in details.get("content", {}).items():
                 class_name = ""
-                if ref := content["schema"].get("$ref", False):
+                if ref := content["schema"].get("$ref"):
                     class_name = utils.class_name_titled(utils.schema_ref(ref))
-                elif title := content["schema"].get("title", False):
+                elif title := content["schema"].get("title"):
                     class_name = title
                 else:
                     # No idea, using the encoding?
                     class_name = encoding
                 class_name = utils.class_name_titled(class_name)
                 input_classes.append(class_name)
-        return list(set(input_classes))
+        # Deduplicate, keeping the order so the generated client is stable
+        return list(dict.fromkeys(input_classes))
 
     def generate_response_types(self, responses: dict, func_name: str) -> str:
         response_class_names = self.get_response_class_names(responses=responses, func_name=func_name)
@@ -170,10 +199,10 @@ class ClientsGenerator:
 
     def generate_input_types(self, request_body: dict) -> str:
         input_class_names = self.get_input_class_names(inputs={"": request_body})
-        for input_class in input_class_names:
-            if input_class not in self.schemas_generator.schemas.keys():
-                # It doesn't exist! Generate the schema for it
-                self.schemas_generator.generate_input_class(schema=request_body)
+        schemas = self.schemas_generator.schemas
+        if any(input_class not in schemas for input_class in input_class_names):
+            # It doesn't exist! Generate the schema for it
+            self.schemas_generator.generate_input_class(schema=request_body)
         if len(input_class_names) > 1:
             return utils.union_for_py_ver([f"schemas.{r}" for r in input_class_names])
         elif len(input_class_names) == 0:
@@ -196,17 +225,18 @@ class ClientsGenerator:
             additional_parameters=additional_parameters,
         )
         if query_args := function_arguments.query_args:
-            api_url = url + utils.create_query_args(list(query_args.keys()))
+            api_url = url + utils.create_query_args(query_args)
         else:
             api_url = url
-        if method in ["post", "put", "patch"] and not operation.get("requestBody"):
-            data_class_name = "None"
-        elif method in ["post", "put", "patch"]:
-            data_class_name = self.generate_input_types(operation.get("requestBody", {}))
+        if method in self.methods_with_body:
+            if request_body := operation.get("requestBody"):
+                data_class_name = self.generate_input_types(request_body)
+            else:
+                data_class_name = "None"
         else:
             data_class_name = None
         self.results[method] += 1
-        template = writer.templates.get_template(self.method_template_map[method])
+        template = self.method_templates[method]
         if headers := function_arguments.headers_args:
             header_class_name = self.schemas_generator.generate_headers_class(
                 properties=headers,
@@ -225,16 +255,19 @@ class ClientsGenerator:
             method=method,
             summary=operation.get("summary", summary),
         )
-        writer.write_to_client(content=content, output_dir=self.output_dir)
+        self.append_to_client(content)
 
     def write_path_to_client(self, path: dict) -> None:
         url, operations = path
+        valid_methods = self.valid_methods
+        additional_parameters = operations.get("parameters", [])
+        summary = operations.get("summary", None)
         for method, operation in operations.items():
-            if method.lower() in self.method_template_map.keys():
+            if method.lower() in valid_methods:
                 self.generate_function(
                     operation=operation,
                     method=method,
                     url=url,
-                    additional_parameters=operations.get("parameters", []),
-                    summary=operations.get("summary", None),
+                    additional_parameters=additional_parameters,
+                    summary=summary,
                 )
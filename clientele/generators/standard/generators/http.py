@@ -1,4 +1,5 @@
 from collections import defaultdict
+from typing import Optional
 
 from openapi_core import Spec
 from rich.console import Console
@@ -35,41 +36,35 @@ class HTTPGenerator:
     def writeable_function_and_status_codes_bundle(self) -> str:
         return f"\nfunc_response_code_maps = {self.function_and_status_codes_bundle}"
 
+    def get_auth_template_name(self, security_schemes: dict) -> Optional[str]:
+        """
+        Pick the client template for the spec's security schemes.
+        The first basic or bearer http scheme is used, unless the spec
+        has an oauth2 scheme, which always gets the bearer client.
+        """
+        template_name = None
+        for info in security_schemes.values():
+            if info["type"] == "oauth2":
+                return "bearer_client.jinja2"
+            if template_name is None and info["type"] == "http" and info["scheme"].lower() in ["basic", "bearer"]:
+                if info["scheme"] == "bearer":
+                    template_name = "bearer_client.jinja2"
+                else:  # Can only be "basic" at this point
+                    template_name = "basic_client.jinja2"
+                console.log(f"[yellow]Please see {self.output_dir}config.py to set authentication variables")
+        return template_name
+
     def generate_http_content(self) -> None:
         writer.write_to_http(self.writeable_function_and_status_codes_bundle(), self.output_dir)
-        client_generated = False
         client_type = "AsyncClient" if self.asyncio else "Client"
+        template_name = None
         if security_schemes := self.spec["components"].get("securitySchemes"):
             console.log("client has authentication...")
-            for _, info in security_schemes.items():
-                if (
-                    info["type"] == "http"
-                    and info["scheme"].lower() in ["basic", "bearer"]
-                    and client_generated is False
-                ):
-                    client_generated = True
-                    if info["scheme"] == "bearer":
-                        template = writer.templates.get_template("bearer_client.jinja2")
-                        content = template.render(
-                            client_type=client_type,
-                        )
-                    else:  # Can only be "basic" at this point
-                        template = writer.templates.get_template("basic_client.jinja2")
-                        content = template.render(
-                            client_type=client_type,
-                        )
-                    console.log(f"[yellow]Please see {self.output_dir}config.py to set authentication variables")
-                elif info["type"] == "oauth2":
-                    template = writer.templates.get_template("bearer_client.jinja2")
-                    content = template.render(
-                        client_type=client_type,
-                    )
-                    client_generated = True
-        if client_generated is False:
+            template_name = self.get_auth_template_name(security_schemes)
+        if template_name is None:
             console.log(f"Generating {'async' if self.asyncio else 'sync'} client...")
-            template = writer.templates.get_template("client.jinja2")
-            content = template.render(client_type=client_type)
-            client_generated = True
+            template_name = "client.jinja2"
+        content = writer.templates.get_template(template_name).render(client_type=client_type)
         writer.write_to_http(content, output_dir=self.output_dir)
         if self.asyncio:
             content = writer.templates.get_template("async_methods.jinja2").render()
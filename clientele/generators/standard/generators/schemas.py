@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import Callable, Optional
 
+from jinja2 import Template
 from openapi_core import Spec
 from rich.console import Console
 
@@ -7,6 +8,11 @@ from clientele.generators.standard import utils, writer
 
 console = Console()
 
+_PROPERTY_FMT = "    %s: %s\n"
+_OPTIONAL_PROPERTY_FMT = "    %s: typing.Optional[%s]\n"
+_ENUM_FMT = "    %s = %s\n"
+_HEADER_FMT = '    %s: %s = pydantic.Field(serialization_alias="%s")'
+
 
 class SchemasGenerator:
     """
@@ -16,22 +22,25 @@ class SchemasGenerator:
     spec: Spec
     schemas: dict[str, str]
     output_dir: str
+    rendered_classes: set[tuple[str, str, bool]]
+    append_to_schemas: Callable[[str], None]
+    schema_class_template: Template
 
     def __init__(self, spec: Spec, output_dir: str) -> None:
         self.spec = spec
         self.schemas = {}
         self.output_dir = output_dir
+        self.rendered_classes = set()
+        self.append_to_schemas = writer.get_appender(output_dir, "schemas.py")
+        self.schema_class_template = writer.templates.get_template("schema_class.jinja2")
 
     generated_response_class_names: list[str] = []
 
-    def generate_enum_properties(self, properties: dict) -> str:
+    def generate_enum_properties_from_list(self, values: list) -> str:
         """
         Generate a string list of the properties for this enum.
         """
-        content = ""
-        for arg, arg_details in properties.items():
-            content = content + f"""    {utils.snake_case_prop(arg.upper())} = {utils.get_type(arg_details)}\n"""
-        return content
+        return "".join([_ENUM_FMT % (utils.snake_case_prop(v.upper()), f'"{v}"') for v in values])
 
     def generate_headers_class(self, properties: dict, func_name: str) -> str:
         """
@@ -41,52 +50,67 @@ class SchemasGenerator:
         have - separators and python detests that, so we're using
         the alias trick to get around that
         """
-        template = writer.templates.get_template("schema_class.jinja2")
         class_name = f"{utils.class_name_titled(func_name)}Headers"
-        string_props = "\n".join(
-            f'    {utils.snake_case_prop(k)}: {v} = pydantic.Field(serialization_alias="{k}")'
-            for k, v in properties.items()
-        )
-        content = template.render(class_name=class_name, properties=string_props, enum=False)
-        writer.write_to_schemas(
-            content,
-            output_dir=self.output_dir,
-        )
+        string_props = "\n".join([_HEADER_FMT % (utils.snake_case_prop(k), v, k) for k, v in properties.items()])
+        content = self.schema_class_template.render(class_name=class_name, properties=string_props, enum=False)
+        self.append_to_schemas(content)
         return f"typing.Optional[schemas.{utils.class_name_titled(func_name)}Headers]"
 
     def generate_class_properties(self, properties: dict, required: Optional[list] = None) -> str:
         """
         Generate a string list of the properties for this pydantic class.
         """
-        content = ""
+        lines: list[str] = []
+        append = lines.append
+        get_type = utils.get_type
+        # An empty set is falsy, so no "required" list still means nothing is optional
+        required_names = frozenset(required or ())
         for arg, arg_details in properties.items():
-            arg_type = utils.get_type(arg_details)
-            is_optional = required and arg not in required
-            type_string = is_optional and f"typing.Optional[{arg_type}]" or arg_type
-            content = content + f"""    {arg}: {type_string}\n"""
-        return content
+            is_optional = required_names and arg not in required_names
+            template = _OPTIONAL_PROPERTY_FMT if is_optional else _PROPERTY_FMT
+            append(template % (arg, get_type(arg_details)))
+        return "".join(lines)
 
     def generate_input_class(self, schema: dict) -> None:
         if content := schema.get("content"):
-            for encoding, input_schema in content.items():
-                class_name = ""
-                if ref := input_schema["schema"].get("$ref", False):
-                    class_name = utils.class_name_titled(utils.schema_ref(ref))
-                elif title := input_schema["schema"].get("title", False):
-                    class_name = utils.class_name_titled(title)
-                else:
-                    # No idea, using the encoding?
-                    class_name = utils.class_name_titled(encoding)
-                properties = self.generate_class_properties(
-                    properties=input_schema["schema"].get("properties", {}),
-                    required=input_schema["schema"].get("required", None),
-                )
-                template = writer.templates.get_template("schema_class.jinja2")
-                out_content = template.render(class_name=class_name, properties=properties, enum=False)
-            writer.write_to_schemas(
-                out_content,
-                output_dir=self.output_dir,
+            # Only the class for the last encoding is written out, so skip rendering the others
+            encoding, input_schema = next(reversed(content.items()))
+            class_name = ""
+            if ref := input_schema["schema"].get("$ref"):
+                class_name = utils.class_name_titled(utils.schema_ref(ref))
+            elif title := input_schema["schema"].get("title"):
+                class_name = utils.class_name_titled(title)
+            else:
+                # No idea, using the encoding?
+                class_name = utils.class_name_titled(encoding)
+            properties = self.generate_class_properties(
+                properties=input_schema["schema"].get("properties", {}),
+                required=input_schema["schema"].get("required", None),
             )
+            out_content = self.schema_class_template.render(class_name=class_name, properties=properties, enum=False)
+            self.append_to_schemas(out_content)
+
+    def generate_all_of_properties(self, other_ref: dict) -> str:
+        """
+        Generate the properties that one "allOf" entry adds to a class.
+        """
+        if is_ref := other_ref.get("$ref"):
+            other_schema_key = utils.class_name_titled(utils.schema_ref(is_ref))
+            if other_schema_key in self.schemas:
+                return self.schemas[other_schema_key]
+            # It's a ref but we've just not made it yet
+            schema_model = utils.get_schema_from_ref(spec=self.spec, ref=is_ref)
+            return self.generate_class_properties(
+                properties=schema_model.get("properties", {}),
+                required=schema_model.get("required", None),
+            )
+        # It's not a ref and we need to figure out what it is
+        if other_ref.get("type") == "object":
+            return self.generate_class_properties(
+                properties=other_ref.get("properties", {}),
+                required=other_ref.get("required", None),
+            )
+        return ""
 
     def make_schema_class(self, schema_key: str, schema: dict) -> None:
         schema_key = utils.class_name_titled(schema_key)
@@ -94,54 +118,59 @@ class SchemasGenerator:
         properties: str = ""
         if all_of := schema.get("allOf"):
             # This schema uses "all of" the properties inside it
-            for other_ref in all_of:
-                is_ref = other_ref.get("$ref", False)
-                if is_ref:
-                    other_schema_key = utils.class_name_titled(utils.schema_ref(is_ref))
-                    if other_schema_key in self.schemas:
-                        properties += self.schemas[other_schema_key]
-                    else:
-                        # It's a ref but we've just not made it yet
-                        schema_model = utils.get_schema_from_ref(spec=self.spec, ref=is_ref)
-                        properties += self.generate_class_properties(
-                            properties=schema_model.get("properties", {}),
-                            required=schema_model.get("required", None),
-                        )
-                else:
-                    # It's not a ref and we need to figure out what it is
-                    if other_ref.get("type") == "object":
-                        properties += self.generate_class_properties(
-                            properties=other_ref.get("properties", {}),
-                            required=other_ref.get("required", None),
-                        )
+            properties = "".join([self.generate_all_of_properties(other_ref) for other_ref in all_of])
         elif schema.get("enum"):
             enum = True
-            properties = self.generate_enum_properties({v: {"type": f'"{v}"'} for v in schema["enum"]})
+            properties = self.generate_enum_properties_from_list(schema["enum"])
         else:
             properties = self.generate_class_properties(
                 properties=schema.get("properties", {}),
                 required=schema.get("required", None),
             )
         self.schemas[schema_key] = properties
-        template = writer.templates.get_template("schema_class.jinja2")
-        content = template.render(class_name=schema_key, properties=properties, enum=enum)
-        writer.write_to_schemas(
-            content,
-            output_dir=self.output_dir,
-        )
+        rendered_key = (schema_key, properties, enum)
+        if rendered_key in self.rendered_classes:
+            # We've already written this exact class out
+            return
+        self.rendered_classes.add(rendered_key)
+        content = self.schema_class_template.render(class_name=schema_key, properties=properties, enum=enum)
+        self.append_to_schemas(content)
 
     def write_helpers(self) -> None:
         template = writer.templates.get_template("schema_helpers.jinja2")
         content = template.render()
-        writer.write_to_schemas(
-            content,
-            output_dir=self.output_dir,
-        )
+        self.append_to_schemas(content)
+
+    def schema_keys_in_dependency_order(self, schemas: dict) -> list[str]:
+        """
+        Order the schema keys so that any schema referenced through "allOf"
+        comes before the schemas that use it. Otherwise the original order
+        is kept. Schemas in a reference cycle are left where the walk finds
+        them, and make_schema_class resolves those refs lazily.
+        """
+        ordered: list[str] = []
+        visited: set[str] = set()
+
+        def visit(schema_key: str) -> None:
+            if schema_key in visited:
+                return
+            visited.add(schema_key)
+            for other_ref in schemas[schema_key].get("allOf", []):
+                if ref := other_ref.get("$ref"):
+                    other_schema_key = utils.schema_ref(ref)
+                    if other_schema_key in schemas:
+                        visit(other_schema_key)
+            ordered.append(schema_key)
+
+        for schema_key in schemas:
+            visit(schema_key)
+        return ordered
 
     def generate_schema_classes(self) -> None:
         """
         Generates all Pydantic schema classes.
         """
-        for schema_key, schema in self.spec["components"]["schemas"].items():
-            self.make_schema_class(schema_key=schema_key, schema=schema)
+        schemas = self.spec["components"]["schemas"]
+        for schema_key in self.schema_keys_in_dependency_order(schemas):
+            self.make_schema_class(schema_key=schema_key, schema=schemas[schema_key])
         console.log(f"Generated {len(self.schemas.items())} schemas...")
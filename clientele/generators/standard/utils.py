@@ -1,4 +1,6 @@
+import functools
 import re
+from typing import Iterable
 
 from openapi_core import Spec
 
@@ -16,6 +18,17 @@ class DataType:
     ANY_OF = "anyOf"
 
 
+# Characters that become word breaks in class names
+_CLASS_NAME_TRANSLATION = str.maketrans(".-_></", "      ")
+# "-" and "." become underscores, "<" and ">" appear in some OpenAPI schemas and are dropped
+_SNAKE_CASE_PROP_TRANSLATION = str.maketrans("-.", "__", "><")
+_FUNC_NAME_TRANSLATION = str.maketrans("/-.", "___")
+_UPPER_SPLIT_RE = re.compile(".[^A-Z]*")
+# python keywords need to be converted
+_RESERVED_WORDS = frozenset(["from"])
+
+
+@functools.lru_cache(maxsize=None)
 def class_name_titled(input_str: str) -> str:
     """
     Make the input string suitable for a class name
@@ -23,8 +36,7 @@ def class_name_titled(input_str: str) -> str:
     # Capitalize the first letter always
     input_str = input_str[:1].title() + input_str[1:]
     # Remove any bad characters with an empty space
-    for badstr in [".", "-", "_", ">", "<", "/"]:
-        input_str = input_str.replace(badstr, " ")
+    input_str = input_str.translate(_CLASS_NAME_TRANSLATION)
     if " " in input_str:
         # Capitalize all the spaces
         input_str = input_str.title()
@@ -33,20 +45,14 @@ def class_name_titled(input_str: str) -> str:
     return input_str
 
 
+@functools.lru_cache(maxsize=None)
 def snake_case_prop(input_str: str) -> str:
     """
     Clean a property to not have invalid characters.
     Returns a "snake_case" version of the input string
     """
-    # These strings appear in some OpenAPI schemas
-    for dropchar in [">", "<"]:
-        input_str = input_str.replace(dropchar, "")
-    # These we can just convert to an underscore
-    for badstr in ["-", "."]:
-        input_str = input_str.replace(badstr, "_")
-    # python keywords need to be converted
-    reserved_words = ["from"]
-    if input_str in reserved_words:
+    input_str = input_str.translate(_SNAKE_CASE_PROP_TRANSLATION)
+    if input_str in _RESERVED_WORDS:
         input_str = input_str + "_"
     # Retain all-uppercase strings, otherwise convert to camel case
     if not input_str.isupper():
@@ -55,16 +61,14 @@ def snake_case_prop(input_str: str) -> str:
 
 
 def _split_upper(s):
-    res = re.findall(".[^A-Z]*", s)
+    res = _UPPER_SPLIT_RE.findall(s)
     if len(res) > 1:
         return "_".join(res)
     return res[0]
 
 
 def _snake_case(s):
-    for badchar in ["/", "-", "."]:
-        s = s.replace(badchar, "_")
-    s = _split_upper(s)
+    s = _split_upper(s.translate(_FUNC_NAME_TRANSLATION))
     if s[0] == "_":
         s = s[1:]
     return s.lower()
@@ -103,14 +107,16 @@ def get_type(t):
     return t_type
 
 
-def create_query_args(query_args: list[str]) -> str:
-    return "?" + "&".join([f"{p}=" + "{" + p + "}" for p in query_args])
+def create_query_args(query_args: Iterable[str]) -> str:
+    return "?" + "&".join([f"{p}={{{p}}}" for p in query_args])
 
 
+@functools.lru_cache(maxsize=None)
 def schema_ref(ref: str) -> str:
     return ref.replace("#/components/schemas/", "")
 
 
+@functools.lru_cache(maxsize=None)
 def param_ref(ref: str) -> str:
     return ref.replace("#/components/parameters/", "")
 
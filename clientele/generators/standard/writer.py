@@ -1,44 +1,162 @@
+import hashlib
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Optional
 
 from jinja2 import Environment, PackageLoader
 
-templates = Environment(loader=PackageLoader("clientele", "generators/standard/templates/"))
+from clientele import utils
+
+_templates_loader = PackageLoader("clientele", "generators/standard/templates/")
+templates = Environment(
+    loader=_templates_loader,
+    # Templates ship with the package and never change underneath us
+    auto_reload=False,
+    bytecode_cache=utils.get_template_bytecode_cache(),
+)
+
+# Records the spec a client was generated from, see StandardGenerator.get_spec_hash()
+SPEC_HASH_FILE_NAME = ".clientele.hash"
+
+# Content is buffered per file, already encoded, and written out once by flush_buffers()
+_file_buffers: dict[Path, bytearray] = defaultdict(bytearray)
+
+
+def get_templates_digest() -> str:
+    """
+    Returns a digest of the source of every template, so a change to
+    the templates can be told apart from a client generated before it.
+    """
+    digest = hashlib.sha256()
+    for name in _templates_loader.list_templates():
+        source, _, _ = _templates_loader.get_source(templates, name)
+        digest.update(name.encode("utf-8"))
+        digest.update(source.encode("utf-8"))
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _output_path(output_dir: str, file_name: str) -> Path:
+    return Path(output_dir) / file_name
 
 
 def write_to_schemas(content: str, output_dir: str) -> None:
-    path = Path(output_dir) / "schemas.py"
+    path = _output_path(output_dir, "schemas.py")
     _write_to(path, content)
 
 
 def write_to_http(content: str, output_dir: str) -> None:
-    path = Path(output_dir) / "http.py"
+    path = _output_path(output_dir, "http.py")
     _write_to(path, content)
 
 
 def write_to_client(content: str, output_dir: str) -> None:
-    path = Path(output_dir) / "client.py"
+    path = _output_path(output_dir, "client.py")
     _write_to(path, content)
 
 
 def write_to_manifest(content: str, output_dir: str) -> None:
-    path = Path(output_dir) / "MANIFEST.md"
+    path = _output_path(output_dir, "MANIFEST.md")
     _write_to(path, content)
 
 
 def write_to_config(content: str, output_dir: str) -> None:
-    path = Path(output_dir) / "config.py"
+    path = _output_path(output_dir, "config.py")
+    _write_to(path, content)
+
+
+def write_to_spec_hash(content: str, output_dir: str) -> None:
+    path = _output_path(output_dir, SPEC_HASH_FILE_NAME)
     _write_to(path, content)
 
 
+def read_spec_hash(output_dir: str) -> Optional[str]:
+    """
+    Returns the spec hash recorded by the last generation, if there is one.
+    """
+    try:
+        return _output_path(output_dir, SPEC_HASH_FILE_NAME).read_text()
+    except OSError:
+        return None
+
+
+def remove_spec_hash(output_dir: str) -> None:
+    """
+    Forget the spec hash of the last generation, for when the client is being replaced.
+    """
+    _output_path(output_dir, SPEC_HASH_FILE_NAME).unlink(missing_ok=True)
+
+
 def write_to_init(output_dir: str) -> None:
-    path = Path(output_dir) / "__init__.py"
-    _write_to(path, "")
+    # Nothing to buffer, the file just needs to exist
+    path = _output_path(output_dir, "__init__.py")
+    if not path.is_file():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+
+def get_appender(output_dir: str, file_name: str) -> Callable[[str], None]:
+    """
+    Returns a function that appends to the buffer for this file, so
+    generators writing to it in a loop can skip the lookups.
+    """
+    extend = _file_buffers[_output_path(output_dir, file_name)].extend
+
+    def append(content: str) -> None:
+        extend(content.encode("utf-8"))
+
+    return append
 
 
 def _write_to(
     path: Path,
     content: str,
 ) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a+") as f:
-        f.write(content)
+    _buffer_content(path, content)
+
+
+def _buffer_content(path: Path, content: str) -> None:
+    _file_buffers[path] += content.encode("utf-8")
+
+
+def reset_buffers(output_dir: str) -> None:
+    """
+    Drop anything buffered for output_dir, such as the partial
+    output of a generation that failed part way through.
+    """
+    output_path = Path(output_dir)
+    for path, buffer in _file_buffers.items():
+        if path.parent == output_path:
+            # Clear in place so appenders handed out by get_appender stay valid
+            buffer.clear()
+
+
+def format_buffers(file_suffix: str, format_content: Callable[[str], str]) -> None:
+    """
+    Run format_content over every buffered file with this suffix,
+    so the content is formatted before it is written out.
+    """
+    for path, buffer in _file_buffers.items():
+        if buffer and path.suffix == file_suffix:
+            # Replace in place so appenders handed out by get_appender stay valid
+            buffer[:] = format_content(buffer.decode("utf-8")).encode("utf-8")
+
+
+def flush_buffers() -> None:
+    """
+    Write all the buffered content out to disk.
+    Each file is opened once and its buffer written in a single call.
+    Files that already hold exactly this content are left untouched.
+    """
+    created_dirs: set[Path] = set()
+    for path, buffer in _file_buffers.items():
+        if not buffer:
+            continue
+        if path.parent not in created_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(path.parent)
+        if not (path.is_file() and path.read_bytes() == buffer):
+            path.write_bytes(buffer)
+        # Clear in place so appenders handed out by get_appender stay valid
+        buffer.clear()
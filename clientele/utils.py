@@ -1,4 +1,8 @@
 import os
+from pathlib import Path
+from typing import Optional
+
+from jinja2 import FileSystemBytecodeCache
 
 
 def get_client_project_directory_path(output_dir: str) -> str:
@@ -8,3 +12,19 @@ def get_client_project_directory_path(output_dir: str) -> str:
     project root directory.
     """
     return ".".join(os.path.join(output_dir).split("/")[:-1])
+
+
+def get_template_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """
+    Returns a bytecode cache so compiled templates can be reused
+    between runs. If the cache directory can't be created we just
+    go without one.
+    """
+    try:
+        cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        cache_dir = cache_home / "clientele" / "jinja"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except (OSError, RuntimeError, KeyError):
+        # Path.home() raises if there is no home directory to be found
+        return None
+    return FileSystemBytecodeCache(directory=str(cache_dir))
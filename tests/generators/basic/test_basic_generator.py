@@ -0,0 +1,12 @@
+from clientele.generators.basic import writer
+from clientele.generators.basic.generator import BasicGenerator
+
+
+def test_generate_drops_partial_output_from_a_failed_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # Left behind by a generation that raised before flushing
+    writer.write_to_client("partial output from a failed run\n", output_dir="client/")
+    BasicGenerator(output_dir="client/").generate()
+    client_py = (tmp_path / "client" / "client.py").read_text()
+    assert "partial output from a failed run" not in client_py
+    assert client_py == writer.templates.get_template("client_py.jinja2").render(client_project_directory_path="client")
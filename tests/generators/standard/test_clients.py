@@ -0,0 +1,36 @@
+import pytest
+from openapi_core import Spec
+
+from clientele.generators.standard import writer
+from clientele.generators.standard.generators import clients, http, schemas
+
+SPEC = {"openapi": "3.0.2", "info": {"title": "Test", "version": "0.1.0"}, "paths": {}}
+
+
+@pytest.fixture
+def clients_generator(tmp_path):
+    output_dir = str(tmp_path)
+    spec = Spec.from_dict(SPEC)
+    http_generator = http.HTTPGenerator(spec=spec, output_dir=output_dir, asyncio=False)
+    yield clients.ClientsGenerator(
+        spec=spec,
+        output_dir=output_dir,
+        schemas_generator=schemas.SchemasGenerator(spec=spec, output_dir=output_dir),
+        http_generator=http_generator,
+        asyncio=False,
+    )
+    writer.reset_buffers(output_dir)
+
+
+def test_get_response_class_names_keeps_the_last_schema_for_a_shared_name(clients_generator):
+    responses = {
+        "200": {
+            "content": {
+                "application/json": {"schema": {"type": "string"}},
+                "application/xml": {"schema": {"type": "integer"}},
+            }
+        }
+    }
+    class_names = clients_generator.get_response_class_names(responses=responses, func_name="get_thing")
+    assert class_names == ["GetThing200Response"]
+    assert clients_generator.schemas_generator.schemas["GetThing200Response"] == "    test: int\n"
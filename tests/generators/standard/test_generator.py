@@ -0,0 +1,100 @@
+import os
+from io import BytesIO
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from openapi_core import Spec
+
+from clientele.generators.standard import writer
+from clientele.generators.standard.generator import StandardGenerator
+
+SPEC_FILE = Path(__file__).parents[3] / "example_openapi_specs" / "simple.json"
+
+
+def make_generator(regen: bool = False, spec_content: Optional[bytes] = None) -> StandardGenerator:
+    if spec_content is None:
+        spec_content = SPEC_FILE.read_bytes()
+    return StandardGenerator(
+        spec=Spec.from_file(BytesIO(spec_content)),
+        output_dir="client/",
+        asyncio=False,
+        regen=regen,
+        url=None,
+        file=str(SPEC_FILE),
+        spec_content=spec_content,
+    )
+
+
+@pytest.fixture
+def generated_client(tmp_path, monkeypatch):
+    # The generated imports are based on the output path, so keep it relative
+    monkeypatch.chdir(tmp_path)
+    output_dir = tmp_path / "client"
+    assert make_generator().generate() is True
+    assert (output_dir / writer.SPEC_HASH_FILE_NAME).exists()
+    return output_dir
+
+
+def test_unchanged_client_is_not_regenerated(generated_client):
+    client_file = generated_client / "client.py"
+    os.utime(client_file, ns=(0, 0))
+    generator = make_generator()
+    assert generator.prevent_accidental_regens() is True
+    assert generator.generate() is False
+    assert client_file.stat().st_mtime_ns == 0
+
+
+def test_changed_spec_is_regenerated(generated_client):
+    spec_content = SPEC_FILE.read_bytes().replace(b'"title":', b'"title": "Changed", "x-title":', 1)
+    generator = make_generator(spec_content=spec_content)
+    assert generator.client_is_up_to_date() is False
+    # An existing client still needs --regen to be replaced
+    assert generator.prevent_accidental_regens() is False
+    generator = make_generator(regen=True, spec_content=spec_content)
+    assert generator.generate() is True
+    assert writer.read_spec_hash("client/") == generator.spec_hash
+
+
+def test_changed_templates_are_regenerated(generated_client, monkeypatch):
+    monkeypatch.setattr(writer, "get_templates_digest", lambda: "changed")
+    assert make_generator().client_is_up_to_date() is False
+
+
+def test_deleted_file_is_regenerated(generated_client):
+    (generated_client / "schemas.py").unlink()
+    generator = make_generator()
+    assert generator.client_is_up_to_date() is False
+    assert make_generator(regen=True).generate() is True
+    assert (generated_client / "schemas.py").exists()
+
+
+def test_regen_always_generates(generated_client):
+    generator = make_generator(regen=True)
+    assert generator.client_is_up_to_date() is True
+    assert generator.generate() is True
+
+
+def test_regenerating_without_spec_content_removes_the_old_hash(generated_client):
+    generator = StandardGenerator(
+        spec=Spec.from_file(BytesIO(SPEC_FILE.read_bytes())),
+        output_dir="client/",
+        asyncio=False,
+        regen=True,
+        url=None,
+        file=None,
+    )
+    assert generator.spec_hash is None
+    assert generator.generate() is True
+    assert not (generated_client / writer.SPEC_HASH_FILE_NAME).exists()
+    assert make_generator().client_is_up_to_date() is False
+
+
+def test_failed_formatting_removes_the_old_hash(generated_client, monkeypatch):
+    def fail_formatting(self):
+        raise RuntimeError("formatting failed")
+
+    monkeypatch.setattr(StandardGenerator, "format_client", fail_formatting)
+    with pytest.raises(RuntimeError):
+        make_generator(regen=True).generate()
+    assert not (generated_client / writer.SPEC_HASH_FILE_NAME).exists()
@@ -0,0 +1,29 @@
+import pytest
+from openapi_core import Spec
+
+from clientele.generators.standard.generators import http
+
+BASIC = {"type": "http", "scheme": "basic"}
+BEARER = {"type": "http", "scheme": "bearer"}
+OAUTH2 = {"type": "oauth2", "flows": {}}
+API_KEY = {"type": "apiKey", "in": "header", "name": "X-API-Key"}
+
+
+@pytest.mark.parametrize(
+    "security_schemes,expected_template_name",
+    [
+        ({"basic": BASIC}, "basic_client.jinja2"),
+        ({"bearer": BEARER}, "bearer_client.jinja2"),
+        ({"oauth": OAUTH2}, "bearer_client.jinja2"),
+        ({"basic": BASIC, "bearer": BEARER}, "basic_client.jinja2"),
+        ({"bearer": BEARER, "basic": BASIC}, "bearer_client.jinja2"),
+        ({"basic": BASIC, "oauth": OAUTH2}, "bearer_client.jinja2"),
+        ({"oauth": OAUTH2, "basic": BASIC}, "bearer_client.jinja2"),
+        ({"api_key": API_KEY}, None),
+        ({"digest": {"type": "http", "scheme": "digest"}}, None),
+    ],
+)
+def test_get_auth_template_name(security_schemes, expected_template_name):
+    spec = Spec.from_dict({"openapi": "3.0.2", "info": {"title": "Test", "version": "0.1.0"}, "paths": {}})
+    generator = http.HTTPGenerator(spec=spec, output_dir="client/", asyncio=False)
+    assert generator.get_auth_template_name(security_schemes) == expected_template_name
@@ -0,0 +1,56 @@
+import pytest
+from openapi_core import Spec
+
+from clientele.generators.standard import writer
+from clientele.generators.standard.generators import schemas
+
+
+def make_spec(component_schemas: dict) -> Spec:
+    return Spec.from_dict(
+        {
+            "openapi": "3.0.2",
+            "info": {"title": "Test", "version": "0.1.0"},
+            "paths": {},
+            "components": {"schemas": component_schemas},
+        }
+    )
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    yield str(tmp_path)
+    writer.reset_buffers(str(tmp_path))
+
+
+def test_schema_keys_in_dependency_order_puts_all_of_refs_first(output_dir):
+    component_schemas = {
+        "First": {"type": "object", "properties": {"a": {"type": "string"}}},
+        "Child": {"allOf": [{"$ref": "#/components/schemas/Parent"}]},
+        "Middle": {"type": "object", "properties": {"b": {"type": "string"}}},
+        "Parent": {"type": "object", "properties": {"c": {"type": "string"}}},
+    }
+    generator = schemas.SchemasGenerator(spec=make_spec(component_schemas), output_dir=output_dir)
+    assert generator.schema_keys_in_dependency_order(component_schemas) == ["First", "Parent", "Child", "Middle"]
+
+
+def test_schema_classes_with_a_reference_cycle(output_dir):
+    component_schemas = {
+        "A": {"allOf": [{"$ref": "#/components/schemas/B"}]},
+        "B": {"allOf": [{"$ref": "#/components/schemas/A"}]},
+    }
+    generator = schemas.SchemasGenerator(spec=make_spec(component_schemas), output_dir=output_dir)
+    assert generator.schema_keys_in_dependency_order(component_schemas) == ["B", "A"]
+    generator.generate_schema_classes()
+    assert set(generator.schemas) == {"A", "B"}
+
+
+def test_make_schema_class_skips_exact_repeats(tmp_path):
+    generator = schemas.SchemasGenerator(spec=make_spec({}), output_dir=str(tmp_path))
+    schema = {"type": "object", "properties": {"a": {"type": "string"}}}
+    generator.make_schema_class("thing", schema=schema)
+    generator.make_schema_class("thing", schema=schema)
+    # Same name, different properties, so this one is still written
+    generator.make_schema_class("thing", schema={"type": "object", "properties": {"b": {"type": "integer"}}})
+    writer.flush_buffers()
+    assert (tmp_path / "schemas.py").read_text().count("class Thing(") == 2
+    assert generator.schemas["Thing"] == "    b: int\n"
@@ -16,3 +16,41 @@ from clientele.generators.standard import utils
 )
 def test_snake_case_prop(input, expected_output):
     assert utils.snake_case_prop(input_str=input) == expected_output
+
+
+@pytest.mark.parametrize(
+    "query_args,expected_output",
+    [
+        (["limit"], "?limit={limit}"),
+        (["limit", "offset"], "?limit={limit}&offset={offset}"),
+        ({"limit": "int", "offset": "int"}, "?limit={limit}&offset={offset}"),
+    ],
+)
+def test_create_query_args(query_args, expected_output):
+    assert utils.create_query_args(query_args=query_args) == expected_output
+
+
+@pytest.mark.parametrize(
+    "input,expected_output",
+    [
+        ("pet", "Pet"),
+        ("create-thread-request", "CreateThreadRequest"),
+        ("Some.Schema_name", "SomeSchemaName"),
+        ("List<Item>", "ListItem"),
+        ("a/b", "AB"),
+    ],
+)
+def test_class_name_titled(input, expected_output):
+    assert utils.class_name_titled(input_str=input) == expected_output
+
+
+@pytest.mark.parametrize(
+    "operation,path,expected_output",
+    [
+        ({"operationId": "getPetById"}, "/pets/{id}", "get_pet_by_id"),
+        ({"operationId": "simple_request_simple_request_get__get"}, "/", "simple_request_simple_request_get"),
+        ({}, "/users/list-all", "users_list_all"),
+    ],
+)
+def test_get_func_name(operation, path, expected_output):
+    assert utils.get_func_name(operation=operation, path=path) == expected_output
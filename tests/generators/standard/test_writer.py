@@ -0,0 +1,55 @@
+import os
+
+from clientele.generators.standard import writer
+
+
+def test_flush_buffers_writes_buffered_content(tmp_path):
+    output_dir = str(tmp_path / "client")
+    append = writer.get_appender(output_dir, "schemas.py")
+    writer.write_to_schemas("import pydantic\n", output_dir=output_dir)
+    append("class Foo(pydantic.BaseModel):\n    pass\n")
+    writer.flush_buffers()
+    assert (tmp_path / "client" / "schemas.py").read_text() == (
+        "import pydantic\nclass Foo(pydantic.BaseModel):\n    pass\n"
+    )
+    # The buffer is emptied, so flushing again does not add anything
+    writer.flush_buffers()
+    assert (tmp_path / "client" / "schemas.py").read_text().count("import pydantic") == 1
+
+
+def test_format_buffers_only_formats_matching_files(tmp_path):
+    output_dir = str(tmp_path)
+    writer.write_to_http("x = 1\n", output_dir=output_dir)
+    writer.write_to_manifest("x = 1\n", output_dir=output_dir)
+    writer.format_buffers(".py", lambda content: content.upper())
+    writer.flush_buffers()
+    assert (tmp_path / "http.py").read_text() == "X = 1\n"
+    assert (tmp_path / "MANIFEST.md").read_text() == "x = 1\n"
+
+
+def test_flush_buffers_does_not_rewrite_unchanged_files(tmp_path):
+    output_dir = str(tmp_path)
+    client_file = tmp_path / "client.py"
+    client_file.write_text("x = 1\n")
+    os.utime(client_file, ns=(0, 0))
+    writer.write_to_client("x = 1\n", output_dir=output_dir)
+    writer.flush_buffers()
+    assert client_file.stat().st_mtime_ns == 0
+    writer.write_to_client("x = 2\n", output_dir=output_dir)
+    writer.flush_buffers()
+    assert client_file.read_text() == "x = 2\n"
+    assert client_file.stat().st_mtime_ns != 0
+
+
+def test_reset_buffers_drops_partial_output(tmp_path):
+    output_dir = str(tmp_path / "client")
+    other_output_dir = str(tmp_path / "other")
+    append = writer.get_appender(output_dir, "client.py")
+    append("partial output from a failed run\n")
+    writer.write_to_client("x = 1\n", output_dir=other_output_dir)
+    writer.reset_buffers(output_dir)
+    # Appenders handed out before the reset keep working
+    append("x = 2\n")
+    writer.flush_buffers()
+    assert (tmp_path / "client" / "client.py").read_text() == "x = 2\n"
+    assert (tmp_path / "other" / "client.py").read_text() == "x = 1\n"
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+from clientele import utils
+
+
+def test_get_template_bytecode_cache_uses_xdg_cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    bytecode_cache = utils.get_template_bytecode_cache()
+    assert bytecode_cache is not None
+    assert (tmp_path / "clientele" / "jinja").is_dir()
+
+
+def test_get_template_bytecode_cache_without_a_home_directory(monkeypatch):
+    def no_home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(Path, "home", no_home)
+    assert utils.get_template_bytecode_cache() is None